@@ -5,81 +5,474 @@ This module implements REST API endpoints for managing portfolio projects.
 Provides full CRUD operations with filtering, pagination, and validation.
 """
 
-from typing import List, Optional
+import hashlib
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from redis.exceptions import RedisError
+from sqlalchemy import ColumnElement, func, select, tuple_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
-from app.core.utils import generate_slug
+from app.core.config import settings
+from app.core.database import get_db, redis_client
+from app.core.utils import decode_cursor, encode_cursor, generate_slug
 from app.models.project import Project
 from app.schemas.project import (
     ProjectCreate,
+    ProjectListItem,
+    ProjectListResponse,
     ProjectPublic,
+    ProjectStatus,
+    ProjectType,
     ProjectUpdate,
 )
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
+# Cached listings live under LIST_CACHE_PREFIX + "<generation>:<digest>";
+# bumping the generation counter on writes orphans every older entry
+LIST_CACHE_PREFIX = "projects:list:"
+LIST_CACHE_GEN_KEY = f"{LIST_CACHE_PREFIX}gen"
+
+# Unique index backing Project.slug and the SQLSTATE of a unique violation
+SLUG_UNIQUE_INDEX = "ix_projects_slug"
+UNIQUE_VIOLATION = "23505"
+
+# Columns fetched for list responses (everything except long_description)
+LIST_COLUMNS = [getattr(Project, field) for field in ProjectListItem.model_fields]
+
+# Column attributes and expressions used on every request, resolved once
+_P_ID, _P_CREATED, _P_UPDATED = Project.id, Project.created_at, Project.updated_at
+_LIST_ORDER_BY = (_P_CREATED.desc(), _P_ID.desc())
+_LIST_KEYSET = tuple_(_P_CREATED, _P_ID)
+
+# Request body validators for validate_json on the raw request bytes
+_CREATE_ADAPTER = TypeAdapter(ProjectCreate)
+_UPDATE_ADAPTER = TypeAdapter(ProjectUpdate)
+
+# Schemas referenced by manually parsed request bodies; merged into the
+# OpenAPI components by app.main so their $refs resolve
+BODY_SCHEMA_DEFINITIONS: Dict[str, Any] = {}
+
+
+async def _validate_body(request: Request, adapter: TypeAdapter) -> Any:
+    """
+    Parse and validate a JSON request body in a single pass.
+    
+    FastAPI already holds a compiled validator per body field, but it first
+    decodes the body with json.loads into a dict and validates that. Here
+    the raw bytes go straight to pydantic-core, which skips the json.loads
+    step; errors are reported in FastAPI's usual 422 format.
+    
+    Args:
+        request: Incoming request
+        adapter: Validator for the expected body type
+        
+    Returns:
+        Validated body
+        
+    Raises:
+        RequestValidationError: If the body is not valid JSON or fails validation
+    """
+    body = await request.body()
+    try:
+        return adapter.validate_json(body)
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [
+                {**error, "loc": ("body", *error["loc"])}
+                for error in exc.errors(include_url=False)
+            ],
+            body=body.decode("utf-8", errors="replace"),
+        )
+
+
+async def _project_create_body(request: Request) -> ProjectCreate:
+    """FastAPI dependency returning the validated ProjectCreate body."""
+    return await _validate_body(request, _CREATE_ADAPTER)
 
-@router.get("/", response_model=List[ProjectPublic], status_code=status.HTTP_200_OK)
-def list_projects(
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+
+async def _project_update_body(request: Request) -> ProjectUpdate:
+    """FastAPI dependency returning the validated ProjectUpdate body."""
+    return await _validate_body(request, _UPDATE_ADAPTER)
+
+
+def _body_openapi(model: type[BaseModel]) -> Dict[str, Any]:
+    """
+    Document a body that is parsed manually instead of by FastAPI.
+    
+    The model and its nested definitions are registered in
+    BODY_SCHEMA_DEFINITIONS so they end up under ``#/components/schemas``
+    and are referenced from there, like bodies FastAPI parses itself. The
+    422 response raised by _validate_body is documented as well.
+    
+    Args:
+        model: Schema of the expected JSON body
+        
+    Returns:
+        ``openapi_extra`` mapping describing the request body and its
+        validation error response
+    """
+    schema = model.model_json_schema(ref_template="#/components/schemas/{model}")
+    BODY_SCHEMA_DEFINITIONS.update(schema.pop("$defs", {}))
+    BODY_SCHEMA_DEFINITIONS[model.__name__] = schema
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"$ref": f"#/components/schemas/{model.__name__}"}
+                }
+            },
+        },
+        "responses": {
+            "422": {
+                "description": "Validation Error",
+                "content": {
+                    "application/json": {
+                        "schema": {"$ref": "#/components/schemas/HTTPValidationError"}
+                    }
+                },
+            }
+        },
+    }
+
+
+def _list_params_digest(params: dict) -> str:
+    """
+    Hash the query parameters that determine a project listing.
+    
+    Used for the Redis cache key and the listing ETag.
+    
+    Args:
+        params: Query parameters that determine the listing
+        
+    Returns:
+        Hex digest of the parameters
+    """
+    return hashlib.blake2b(
+        json.dumps(params, sort_keys=True).encode("utf-8"),
+        digest_size=16,
+    ).hexdigest()
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag (weak comparison).
+    
+    Args:
+        if_none_match: Raw If-None-Match header value, if any
+        etag: Current ETag of the resource
+        
+    Returns:
+        True if the client's cached representation is still current
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tag = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque_tag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def _not_modified(etag: str) -> Response:
+    """Build an empty 304 response carrying the current ETag."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+
+async def _invalidate_list_cache() -> None:
+    """
+    Invalidate all cached project listings after a write.
+    
+    Bumps the cache generation instead of deleting keys, so invalidation
+    is a single O(1) command; entries of older generations are never read
+    again and expire after LIST_CACHE_TTL seconds. Cache errors are logged
+    and ignored.
+    """
+    if redis_client is None:
+        return
+    
+    try:
+        await redis_client.incr(LIST_CACHE_GEN_KEY)
+    except RedisError:
+        logger.warning("Failed to invalidate project list cache", exc_info=True)
+
+
+async def _list_stats(
+    db: AsyncSession,
+    filters: List[ColumnElement[bool]],
+) -> Tuple[int, Optional[datetime]]:
+    """
+    Count projects matching the list filters and find their latest update.
+    
+    Issues a plain ``SELECT count(*), max(updated_at) FROM projects WHERE ...``
+    (no ORDER BY, no subquery). The result provides the listing total and
+    its ETag before any row is hydrated.
+    
+    Args:
+        db: Active database session
+        filters: WHERE clauses applied to the listing
+        
+    Returns:
+        Tuple of (number of matching projects, latest updated_at or None)
+    """
+    result = await db.execute(
+        select(func.count(), func.max(_P_UPDATED))
+        .select_from(Project)
+        .where(*filters)
+    )
+    total, last_updated = result.one()
+    return total, last_updated
+
+
+def _slug_conflict(slug: str) -> HTTPException:
+    """Build the 400 error returned when a slug is already taken."""
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"Project with slug '{slug}' already exists"
+    )
+
+
+def _is_slug_conflict(exc: IntegrityError) -> bool:
+    """
+    Tell whether an IntegrityError is a duplicate slug.
+    
+    Args:
+        exc: Error raised by the database driver
+        
+    Returns:
+        True only for a unique violation on the slug index
+    """
+    if getattr(exc.orig, "sqlstate", None) != UNIQUE_VIOLATION:
+        return False
+    # The asyncpg error (chained as the cause) carries the constraint name
+    return getattr(exc.orig.__cause__, "constraint_name", None) == SLUG_UNIQUE_INDEX
+
+
+async def _commit_with_unique_slug(db: AsyncSession, slug: str) -> None:
+    """
+    Commit the current transaction, mapping slug conflicts to HTTP 400.
+    
+    Slug uniqueness is enforced by the database constraint rather than a
+    prior SELECT, which saves a round trip and avoids the race between
+    checking and writing.
+    
+    Args:
+        db: Active database session
+        slug: Slug being written, used in the error message
+        
+    Raises:
+        HTTPException 400: If another project already uses the slug
+    """
+    try:
+        await db.commit()
+    except IntegrityError as exc:
+        await db.rollback()
+        if _is_slug_conflict(exc):
+            raise _slug_conflict(slug) from exc
+        raise
+
+
+async def _update_project(db: AsyncSession, project_id: int, values: Dict[str, Any]) -> Project:
+    """
+    Apply column values to a project with a single UPDATE ... RETURNING.
+    
+    Avoids loading the row first and replaying each field through the
+    ORM's attribute instrumentation; the updated row comes back from the
+    same statement.
+    
+    Args:
+        db: Active database session
+        project_id: The ID of the project to update
+        values: Column values to set
+        
+    Returns:
+        Updated project
+        
+    Raises:
+        HTTPException 404: If project not found
+        HTTPException 400: If slug already exists for another project
+    """
+    statement = (
+        update(Project)
+        .where(_P_ID == project_id)
+        .values(**values)
+        .returning(Project)
+    )
+    
+    try:
+        project = (await db.execute(statement)).scalar_one_or_none()
+        await db.commit()
+    except IntegrityError as exc:
+        await db.rollback()
+        if _is_slug_conflict(exc):
+            raise _slug_conflict(values["slug"]) from exc
+        raise
+    
+    if not project:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Project with id {project_id} not found"
+        )
+    
+    return project
+
+
+@router.get("/", response_model=ProjectListResponse, status_code=status.HTTP_200_OK)
+async def list_projects(
+    cursor: Optional[str] = Query(None, max_length=128, description="Cursor returned as next_cursor by the previous page"),
     limit: int = Query(100, ge=1, le=100, description="Maximum number of records to return"),
-    project_type: Optional[str] = Query(None, description="Filter by project type"),
-    status_filter: Optional[str] = Query(None, alias="status", description="Filter by status"),
+    project_type: Optional[ProjectType] = Query(None, description="Filter by project type"),
+    status_filter: Optional[ProjectStatus] = Query(None, alias="status", description="Filter by status"),
     featured: Optional[bool] = Query(None, description="Filter by featured flag"),
-    db: Session = Depends(get_db),
-) -> List[Project]:
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db),
+) -> Response:
     """
-    List all projects with optional filtering and pagination.
+    List all projects with optional filtering and keyset pagination.
+    
+    Projects are ordered by creation date (newest first). Pages are
+    addressed by an opaque cursor instead of an offset, so fetching a deep
+    page is an index range seek on (created_at, id) rather than a scan
+    over all skipped rows.
+    
+    When Redis is configured, the serialized response is cached per set of
+    query parameters for LIST_CACHE_TTL seconds and invalidated on writes.
+    Responses carry an ETag; a matching If-None-Match yields 304 before
+    any row is loaded.
     
     Query Parameters:
-        - skip: Number of records to skip (default: 0)
+        - cursor: Cursor of the page to fetch (omit for the first page)
         - limit: Maximum number of records to return (default: 100, max: 100)
         - project_type: Filter by project type (data_engineering, ml_ai, web, automation, saas)
         - status: Filter by status (active, archived, draft)
         - featured: Filter by featured flag (true/false)
     
     Returns:
-        List of projects matching the filters
+        Page of projects matching the filters, their total count, and the
+        cursor of the next page (or 304 Not Modified)
+        
+    Raises:
+        HTTPException 400: If the cursor is malformed
     """
-    query = db.query(Project)
-    
-    # Apply filters
+    params_digest = _list_params_digest({
+        "cursor": cursor,
+        "limit": limit,
+        "project_type": project_type,
+        "status": status_filter,
+        "featured": featured,
+    })
+    cache_key: Optional[str] = None
+    
+    if redis_client is not None:
+        try:
+            generation = int(await redis_client.get(LIST_CACHE_GEN_KEY) or 0)
+            cache_key = f"{LIST_CACHE_PREFIX}{generation}:{params_digest}"
+            cached, cached_etag = await redis_client.mget(cache_key, f"{cache_key}:etag")
+        except RedisError:
+            logger.warning("Failed to read project list cache", exc_info=True)
+            cached = cached_etag = None
+        if cached is not None and cached_etag is not None:
+            etag = cached_etag.decode("ascii")
+            if _etag_matches(if_none_match, etag):
+                return _not_modified(etag)
+            return Response(content=cached, media_type="application/json", headers={"ETag": etag})
+    
+    # Collect filters (shared by the page query and the total count)
+    filters: List[ColumnElement[bool]] = []
     if project_type:
-        query = query.filter(Project.project_type == project_type)
+        filters.append(Project.project_type == project_type)
     
     if status_filter:
-        query = query.filter(Project.status == status_filter)
+        filters.append(Project.status == status_filter)
     
     if featured is not None:
-        query = query.filter(Project.featured == featured)
+        filters.append(Project.featured == featured)
     
-    # Apply pagination and ordering
-    projects = query.order_by(Project.created_at.desc()).offset(skip).limit(limit).all()
+    query = select(*LIST_COLUMNS).where(*filters)
     
-    return projects
+    # Continue after the last item of the previous page (validated before
+    # any query so a malformed cursor is always a 400)
+    if cursor:
+        try:
+            last_created_at, last_id = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid pagination cursor"
+            )
+        query = query.where(_LIST_KEYSET < (last_created_at, last_id))
+    
+    # Total and ETag come from one aggregate, before hydrating any row
+    total, last_updated = await _list_stats(db, filters)
+    last_updated_ts = last_updated.timestamp() if last_updated else 0
+    etag = f'W/"{last_updated_ts}-{total}-{params_digest}"'
+    if _etag_matches(if_none_match, etag):
+        return _not_modified(etag)
+    
+    # Fetch one extra row to know whether another page exists
+    result = await db.execute(query.order_by(*_LIST_ORDER_BY).limit(limit + 1))
+    projects = result.all()
+    
+    next_cursor = None
+    if len(projects) > limit:
+        projects = projects[:limit]
+        last = projects[-1]
+        next_cursor = encode_cursor(last.created_at, last.id)
+    
+    body = ProjectListResponse(
+        total=total,
+        page_size=limit,
+        next_cursor=next_cursor,
+        projects=projects,
+    ).model_dump_json()
+    
+    if redis_client is not None and cache_key is not None:
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.set(cache_key, body, ex=settings.LIST_CACHE_TTL)
+                pipe.set(f"{cache_key}:etag", etag, ex=settings.LIST_CACHE_TTL)
+                await pipe.execute()
+        except RedisError:
+            logger.warning("Failed to write project list cache", exc_info=True)
+    
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 @router.get("/{project_id}", response_model=ProjectPublic, status_code=status.HTTP_200_OK)
-def get_project(
+async def get_project(
     project_id: int,
-    db: Session = Depends(get_db),
-) -> Project:
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db),
+) -> Project | Response:
     """
     Get a specific project by ID.
     
+    The response carries an ETag derived from updated_at; a matching
+    If-None-Match yields 304 without serializing the project.
+    
     Args:
         project_id: The ID of the project to retrieve
     
     Returns:
-        Project details
+        Project details (or 304 Not Modified)
         
     Raises:
         HTTPException 404: If project not found
     """
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = await db.get(Project, project_id)
     
     if not project:
         raise HTTPException(
@@ -87,13 +480,23 @@ def get_project(
             detail=f"Project with id {project_id} not found"
         )
     
+    etag = f'W/"{project.updated_at.timestamp()}-{project.id}"'
+    if _etag_matches(if_none_match, etag):
+        return _not_modified(etag)
+    
+    response.headers["ETag"] = etag
     return project
 
 
-@router.post("/", response_model=ProjectPublic, status_code=status.HTTP_201_CREATED)
-def create_project(
-    project_data: ProjectCreate,
-    db: Session = Depends(get_db),
+@router.post(
+    "/",
+    response_model=ProjectPublic,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra=_body_openapi(ProjectCreate),
+)
+async def create_project(
+    project_data: ProjectCreate = Depends(_project_create_body),
+    db: AsyncSession = Depends(get_db),
 ) -> Project:
     """
     Create a new project.
@@ -118,14 +521,6 @@ def create_project(
         # Normalize provided slug
         slug = generate_slug(slug)
     
-    # Check if slug already exists
-    existing_project = db.query(Project).filter(Project.slug == slug).first()
-    if existing_project:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Project with slug '{slug}' already exists"
-        )
-    
     # Create project instance
     project = Project(
         **project_data.model_dump(exclude={"slug"}),
@@ -133,17 +528,22 @@ def create_project(
     )
     
     db.add(project)
-    db.commit()
-    db.refresh(project)
+    await _commit_with_unique_slug(db, slug)
+    await _invalidate_list_cache()
     
     return project
 
 
-@router.put("/{project_id}", response_model=ProjectPublic, status_code=status.HTTP_200_OK)
-def update_project_full(
+@router.put(
+    "/{project_id}",
+    response_model=ProjectPublic,
+    status_code=status.HTTP_200_OK,
+    openapi_extra=_body_openapi(ProjectCreate),
+)
+async def update_project_full(
     project_id: int,
-    project_data: ProjectCreate,
-    db: Session = Depends(get_db),
+    project_data: ProjectCreate = Depends(_project_create_body),
+    db: AsyncSession = Depends(get_db),
 ) -> Project:
     """
     Fully update a project (replaces all fields).
@@ -159,14 +559,6 @@ def update_project_full(
         HTTPException 404: If project not found
         HTTPException 400: If slug already exists for another project
     """
-    # Get existing project
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Project with id {project_id} not found"
-        )
-    
     # Generate or normalize slug
     slug = project_data.slug.strip() if project_data.slug else ""
     if not slug:
@@ -174,35 +566,27 @@ def update_project_full(
     else:
         slug = generate_slug(slug)
     
-    # Check if slug already exists for another project
-    if slug != project.slug:
-        existing_project = db.query(Project).filter(
-            Project.slug == slug,
-            Project.id != project_id
-        ).first()
-        if existing_project:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Project with slug '{slug}' already exists"
-            )
-    
     # Update all fields
-    for field, value in project_data.model_dump(exclude={"slug"}).items():
-        setattr(project, field, value)
-    
-    project.slug = slug
-    
-    db.commit()
-    db.refresh(project)
+    project = await _update_project(
+        db,
+        project_id,
+        {**project_data.model_dump(exclude={"slug"}), "slug": slug},
+    )
+    await _invalidate_list_cache()
     
     return project
 
 
-@router.patch("/{project_id}", response_model=ProjectPublic, status_code=status.HTTP_200_OK)
-def update_project_partial(
+@router.patch(
+    "/{project_id}",
+    response_model=ProjectPublic,
+    status_code=status.HTTP_200_OK,
+    openapi_extra=_body_openapi(ProjectUpdate),
+)
+async def update_project_partial(
     project_id: int,
-    project_data: ProjectUpdate,
-    db: Session = Depends(get_db),
+    project_data: ProjectUpdate = Depends(_project_update_body),
+    db: AsyncSession = Depends(get_db),
 ) -> Project:
     """
     Partially update a project (only updates provided fields).
@@ -218,51 +602,36 @@ def update_project_partial(
         HTTPException 404: If project not found
         HTTPException 400: If slug already exists for another project
     """
-    # Get existing project
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Project with id {project_id} not found"
-        )
-    
     # Get only the fields that were actually provided
     update_data = project_data.model_dump(exclude_unset=True)
     
+    # Nothing to change: return the project as is
+    if not update_data:
+        project = await db.get(Project, project_id)
+        if not project:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Project with id {project_id} not found"
+            )
+        return project
+    
     # Handle slug if provided
     if "slug" in update_data:
         slug = update_data["slug"].strip() if update_data["slug"] else ""
         if slug:
-            slug = generate_slug(slug)
-            
-            # Check if slug already exists for another project
-            if slug != project.slug:
-                existing_project = db.query(Project).filter(
-                    Project.slug == slug,
-                    Project.id != project_id
-                ).first()
-                if existing_project:
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail=f"Project with slug '{slug}' already exists"
-                    )
-            
-            update_data["slug"] = slug
+            update_data["slug"] = generate_slug(slug)
     
     # Update only provided fields
-    for field, value in update_data.items():
-        setattr(project, field, value)
-    
-    db.commit()
-    db.refresh(project)
+    project = await _update_project(db, project_id, update_data)
+    await _invalidate_list_cache()
     
     return project
 
 
 @router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_project(
+async def delete_project(
     project_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> None:
     """
     Delete a project.
@@ -276,7 +645,7 @@ def delete_project(
     Raises:
         HTTPException 404: If project not found
     """
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = await db.get(Project, project_id)
     
     if not project:
         raise HTTPException(
@@ -284,7 +653,8 @@ def delete_project(
             detail=f"Project with id {project_id} not found"
         )
     
-    db.delete(project)
-    db.commit()
+    await db.delete(project)
+    await db.commit()
+    await _invalidate_list_cache()
     
     return None
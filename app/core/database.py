@@ -1,50 +1,68 @@
 """
 Database configuration and session management.
 
-This module sets up SQLAlchemy engine, session factory, and base class
-for declarative models. It also provides a dependency for FastAPI routes.
+This module sets up the async SQLAlchemy engine, session factory, and base
+class for declarative models, plus the optional Redis client used for
+caching. It also provides a dependency for FastAPI routes.
 """
 
-from typing import Generator
-from sqlalchemy import create_engine
+from typing import AsyncGenerator, Optional
+
+import redis.asyncio as redis
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
 
 from app.core.config import settings
 
 
-# Create SQLAlchemy engine
-engine = create_engine(
-    settings.DATABASE_URL,
+# Create async SQLAlchemy engine (asyncpg driver)
+engine = create_async_engine(
+    settings.ASYNC_DATABASE_URL,
     pool_pre_ping=True,  # Verify connections before using them
-    echo=settings.DEBUG,  # Log SQL queries in debug mode
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    echo=settings.SQL_ECHO,  # Log SQL queries only when explicitly enabled
+    echo_pool=False,
 )
 
 # Create SessionLocal class for database sessions
-SessionLocal = sessionmaker(
-    autocommit=False,
+SessionLocal = async_sessionmaker(
+    bind=engine,
+    class_=AsyncSession,
     autoflush=False,
-    bind=engine
+    expire_on_commit=False,  # Keep loaded state after commit (no refresh SELECT)
+)
+
+# Redis client for response caching (None when caching is disabled).
+# Short timeouts keep an unreachable cache from stalling requests.
+redis_client: Optional[redis.Redis] = (
+    redis.from_url(
+        settings.REDIS_URL,
+        socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+    )
+    if settings.REDIS_URL
+    else None
 )
 
 # Base class for declarative models
 Base = declarative_base()
 
 
-def get_db() -> Generator[Session, None, None]:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
-    FastAPI dependency that provides a database session.
+    FastAPI dependency that provides an async database session.
     
     Yields:
-        SQLAlchemy Session object
+        SQLAlchemy AsyncSession object
         
     Usage:
         @app.get("/items/")
-        def read_items(db: Session = Depends(get_db)):
-            return db.query(Item).all()
+        async def read_items(db: AsyncSession = Depends(get_db)):
+            result = await db.execute(select(Item))
+            return result.scalars().all()
     """
-    db = SessionLocal()
-    try:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
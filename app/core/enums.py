@@ -0,0 +1,26 @@
+"""
+Shared enumerations.
+
+This module defines the allowed values for project categories and statuses,
+used by both the SQLAlchemy models and the Pydantic schemas.
+"""
+
+from enum import Enum
+
+
+class ProjectType(str, Enum):
+    """Allowed project categories."""
+    
+    DATA_ENGINEERING = "data_engineering"
+    ML_AI = "ml_ai"
+    WEB = "web"
+    AUTOMATION = "automation"
+    SAAS = "saas"
+
+
+class ProjectStatus(str, Enum):
+    """Allowed project statuses."""
+    
+    ACTIVE = "active"
+    ARCHIVED = "archived"
+    DRAFT = "draft"
@@ -4,16 +4,50 @@ Utility functions for the application.
 This module contains helper functions used across the application.
 """
 
-import re
+import base64
+import functools
+import json
 import unicodedata
+from datetime import datetime
+from typing import Dict, Optional, Tuple
 
+# Range of the int4 primary key (projects.id)
+_INT4_MIN, _INT4_MAX = -2**31, 2**31 - 1
 
+
+def _build_slug_table() -> Dict[int, Optional[str]]:
+    """
+    Build the ``str.translate`` table used by ``generate_slug``.
+    
+    Maps every ASCII character in a single pass: letters and digits to
+    their lowercase form, whitespace, underscores and hyphens to a space
+    (so ``str.split`` can collapse them), and everything else to None
+    (removed).
+    """
+    table: Dict[int, Optional[str]] = {}
+    for code in range(128):
+        char = chr(code)
+        if char.isalnum():
+            table[code] = char.lower()
+        elif char.isspace() or char in "_-":
+            table[code] = " "
+        else:
+            table[code] = None
+    return table
+
+
+_SLUG_TABLE = _build_slug_table()
+
+
+@functools.lru_cache(maxsize=1024)
 def generate_slug(text: str) -> str:
     """
     Generate a URL-friendly slug from text.
     
     Converts text to lowercase, removes accents, replaces spaces with hyphens,
     and removes any characters that are not alphanumeric or hyphens.
+    Results are memoized, as the function is pure and commonly called
+    again with the same title (retries, idempotent PUTs).
     
     Args:
         text: The text to convert to a slug
@@ -29,23 +63,62 @@ def generate_slug(text: str) -> str:
         >>> generate_slug("Project #1: Data Engineering")
         'project-1-data-engineering'
     """
-    # Normalize unicode characters (remove accents)
-    text = unicodedata.normalize('NFKD', text)
-    text = text.encode('ascii', 'ignore').decode('ascii')
+    # Normalize unicode characters (remove accents); ASCII is already normalized
+    if not text.isascii():
+        text = unicodedata.normalize('NFKD', text)
+        text = text.encode('ascii', 'ignore').decode('ascii')
     
-    # Convert to lowercase
-    text = text.lower()
+    # Lowercase, turn separators into spaces and drop anything else
+    text = text.translate(_SLUG_TABLE)
     
-    # Replace spaces and underscores with hyphens
-    text = re.sub(r'[\s_]+', '-', text)
+    # Split on separator runs (also trims the ends) and join with hyphens
+    return '-'.join(text.split())
+
+
+def encode_cursor(created_at: datetime, item_id: int) -> str:
+    """
+    Encode a keyset pagination cursor.
     
-    # Remove any character that is not alphanumeric or hyphen
-    text = re.sub(r'[^a-z0-9-]', '', text)
+    The cursor identifies the last item of a page by its sort key
+    ``(created_at, id)`` and is serialized as URL-safe base64 JSON.
     
-    # Replace multiple consecutive hyphens with a single hyphen
-    text = re.sub(r'-+', '-', text)
+    Args:
+        created_at: Creation timestamp of the last item in the page
+        item_id: ID of the last item in the page
+        
+    Returns:
+        Opaque cursor string
+    """
+    payload = json.dumps([created_at.isoformat(), item_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a keyset pagination cursor produced by ``encode_cursor``.
+    
+    Only values the database can compare against are accepted: a naive
+    timestamp (created_at is TIMESTAMP WITHOUT TIME ZONE) and an integer
+    id within the int4 range.
+    
+    Args:
+        cursor: Opaque cursor string
+        
+    Returns:
+        Tuple of (created_at, id) of the last item of the previous page
+        
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw_created_at, item_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        created_at = datetime.fromisoformat(raw_created_at)
+    except (TypeError, ValueError, RecursionError) as exc:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from exc
     
-    # Remove leading and trailing hyphens
-    text = text.strip('-')
+    if created_at.tzinfo is not None:
+        raise ValueError(f"Invalid cursor (timezone-aware timestamp): {cursor!r}")
+    if type(item_id) is not int or not _INT4_MIN <= item_id <= _INT4_MAX:
+        raise ValueError(f"Invalid cursor (id out of range): {cursor!r}")
     
-    return text
+    return created_at, item_id
@@ -5,8 +5,11 @@ This module initializes the FastAPI application, configures middleware,
 and sets up API routes.
 """
 
+from typing import Any
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.core.config import settings
 
@@ -16,13 +19,14 @@ app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_PREFIX}/openapi.json",
     debug=settings.DEBUG,
+    default_response_class=ORJSONResponse,  # orjson is bundled with fastapi[all]
 )
 
 # Configure CORS middleware
 if settings.BACKEND_CORS_ORIGINS:
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=[str(origin) for origin in settings.BACKEND_CORS_ORIGINS],
+        allow_origins=settings.BACKEND_CORS_ORIGINS,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
@@ -52,3 +56,22 @@ app.include_router(
     tags=["projects"]
 )
 
+
+def custom_openapi() -> dict[str, Any]:
+    """
+    Generate the OpenAPI schema, including models used only by request
+    bodies that are parsed outside FastAPI's body handling.
+    
+    Returns:
+        OpenAPI schema dictionary (cached after the first call)
+    """
+    if app.openapi_schema is None:
+        schema = FastAPI.openapi(app)
+        components = schema.setdefault("components", {}).setdefault("schemas", {})
+        for name, definition in projects.BODY_SCHEMA_DEFINITIONS.items():
+            components.setdefault(name, definition)
+    return app.openapi_schema
+
+
+app.openapi = custom_openapi
+
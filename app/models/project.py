@@ -12,6 +12,8 @@ from sqlalchemy import (
     Boolean,
     Column,
     DateTime,
+    Enum,
+    Index,
     Integer,
     String,
     Text,
@@ -20,6 +22,12 @@ from sqlalchemy import (
 from sqlalchemy.dialects.postgresql import ARRAY
 
 from app.core.database import Base
+from app.core.enums import ProjectStatus, ProjectType
+
+
+def _enum_values(enum_cls: type) -> List[str]:
+    """Persist enum values (e.g. "ml_ai") rather than member names."""
+    return [member.value for member in enum_cls]
 
 
 class Project(Base):
@@ -45,6 +53,9 @@ class Project(Base):
     
     __tablename__ = "projects"
     
+    # Fetch server-generated values (id, timestamps) via RETURNING on flush
+    __mapper_args__ = {"eager_defaults": True}
+    
     # Primary Key
     id = Column(Integer, primary_key=True, autoincrement=True)
     
@@ -57,16 +68,16 @@ class Project(Base):
     # Technical Details
     tech_stack = Column(ARRAY(String))  # PostgreSQL array
     project_type = Column(
-        String(50),
+        Enum(ProjectType, native_enum=False, length=50, values_callable=_enum_values),
         nullable=False,
         comment="Type: data_engineering, ml_ai, web, automation, saas"
     )
     
     # Status and Visibility
     status = Column(
-        String(20),
+        Enum(ProjectStatus, native_enum=False, length=20, values_callable=_enum_values),
         nullable=False,
-        default="active",
+        default=ProjectStatus.ACTIVE,
         comment="Status: active, archived, draft"
     )
     featured = Column(Boolean, default=False, nullable=False)
@@ -91,6 +102,15 @@ class Project(Base):
         onupdate=func.now()
     )
     
+    __table_args__ = (
+        # Keyset pagination: ORDER BY created_at DESC, id DESC
+        Index("ix_projects_created_at_id", created_at.desc(), id.desc()),
+        # Filtered listings: WHERE <filter> = ? ORDER BY created_at DESC
+        Index("ix_projects_featured_created", featured, created_at.desc()),
+        Index("ix_projects_type_created", project_type, created_at.desc()),
+        Index("ix_projects_status_created", status, created_at.desc()),
+    )
+    
     def __repr__(self) -> str:
         """String representation of Project."""
         return (
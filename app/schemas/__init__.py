@@ -8,16 +8,24 @@ from app.schemas.project import (
     ProjectBase,
     ProjectCreate,
     ProjectInDB,
+    ProjectListItem,
     ProjectListResponse,
     ProjectPublic,
+    ProjectStatus,
+    ProjectSummaryBase,
+    ProjectType,
     ProjectUpdate,
 )
 
 __all__ = [
+    "ProjectSummaryBase",
     "ProjectBase",
     "ProjectCreate",
     "ProjectUpdate",
     "ProjectInDB",
     "ProjectPublic",
+    "ProjectListItem",
     "ProjectListResponse",
+    "ProjectType",
+    "ProjectStatus",
 ]
@@ -8,37 +8,40 @@ serialization, and documentation in API endpoints.
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_validator
 
+from app.core.enums import ProjectStatus, ProjectType
 
-class ProjectBase(BaseModel):
+
+class ProjectSummaryBase(BaseModel):
     """
-    Base schema with shared project attributes.
+    Shared project attributes, except the long markdown description.
     
-    Used as a foundation for other project schemas.
+    Foundation for ProjectBase and for the lighter list item schema.
     """
     
     title: str = Field(..., min_length=1, max_length=200, description="Project title")
     slug: str = Field(..., min_length=1, max_length=200, description="URL-friendly identifier")
     short_description: Optional[str] = Field(None, max_length=500, description="Brief summary")
-    long_description: Optional[str] = Field(None, description="Detailed markdown description")
     tech_stack: List[str] = Field(default_factory=list, description="Technologies used")
-    project_type: str = Field(
-        ...,
-        pattern="^(data_engineering|ml_ai|web|automation|saas)$",
-        description="Project category"
-    )
-    status: str = Field(
-        default="active",
-        pattern="^(active|archived|draft)$",
-        description="Project status"
-    )
+    project_type: ProjectType = Field(..., description="Project category")
+    status: ProjectStatus = Field(default=ProjectStatus.ACTIVE, description="Project status")
     github_url: Optional[str] = Field(None, max_length=500, description="GitHub repository URL")
     demo_url: Optional[str] = Field(None, max_length=500, description="Live demo URL")
     image_url: Optional[str] = Field(None, max_length=500, description="Project image URL")
     featured: bool = Field(default=False, description="Featured on homepage")
 
 
+class ProjectBase(ProjectSummaryBase):
+    """
+    Base schema with shared project attributes.
+    
+    Used as a foundation for other project schemas.
+    """
+    
+    long_description: Optional[str] = Field(None, description="Detailed markdown description")
+
+
 class ProjectCreate(ProjectBase):
     """
     Schema for creating a new project.
@@ -61,25 +64,32 @@ class ProjectUpdate(BaseModel):
     short_description: Optional[str] = Field(None, max_length=500)
     long_description: Optional[str] = None
     tech_stack: Optional[List[str]] = None
-    project_type: Optional[str] = Field(
-        None,
-        pattern="^(data_engineering|ml_ai|web|automation|saas)$"
-    )
-    status: Optional[str] = Field(
-        None,
-        pattern="^(active|archived|draft)$"
-    )
+    project_type: Optional[ProjectType] = None
+    status: Optional[ProjectStatus] = None
     github_url: Optional[str] = Field(None, max_length=500)
     demo_url: Optional[str] = Field(None, max_length=500)
     image_url: Optional[str] = Field(None, max_length=500)
     featured: Optional[bool] = None
+    
+    @field_validator("title", "slug", "project_type", "status", "featured")
+    @classmethod
+    def reject_null(cls, v: Optional[object]) -> object:
+        """
+        Reject explicit nulls for fields stored as NOT NULL.
+        
+        Omitting a field leaves it unchanged; sending null is an error.
+        """
+        if v is None:
+            raise ValueError("Field may not be null")
+        return v
 
 
-class ProjectInDB(ProjectBase):
+class ProjectListItem(ProjectSummaryBase):
     """
-    Schema representing a project as stored in database.
+    Schema for projects in list responses.
     
-    Includes all fields including auto-generated ones.
+    Same as ProjectPublic without long_description, which can be a large
+    markdown document and is only needed on the detail endpoint.
     """
     
     id: int = Field(..., description="Unique identifier")
@@ -89,6 +99,17 @@ class ProjectInDB(ProjectBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class ProjectInDB(ProjectBase, ProjectListItem):
+    """
+    Schema representing a project as stored in database.
+    
+    Includes all fields including auto-generated ones: ProjectListItem's
+    fields plus long_description from ProjectBase.
+    """
+    
+    pass
+
+
 class ProjectPublic(ProjectInDB):
     """
     Schema for public project responses.
@@ -103,12 +124,15 @@ class ProjectPublic(ProjectInDB):
 
 class ProjectListResponse(BaseModel):
     """
-    Schema for paginated list of projects.
+    Schema for a cursor-paginated list of projects.
     """
     
-    total: int = Field(..., description="Total number of projects")
-    page: int = Field(..., ge=1, description="Current page number")
-    page_size: int = Field(..., ge=1, le=100, description="Items per page")
-    projects: List[ProjectPublic] = Field(..., description="List of projects")
+    total: int = Field(..., description="Total number of projects matching the filters")
+    page_size: int = Field(..., ge=1, le=100, description="Maximum items per page")
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Cursor for the next page (null when this is the last page)"
+    )
+    projects: List[ProjectListItem] = Field(..., description="List of projects")
     
     model_config = ConfigDict(from_attributes=True)
@@ -5,6 +5,7 @@ This script initializes the database by running Alembic migrations
 and optionally seeding with example data.
 """
 
+import asyncio
 import sys
 from pathlib import Path
 
@@ -13,7 +14,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 from alembic import command
 from alembic.config import Config
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
 
 from app.core.database import SessionLocal, engine
 from app.models.project import Project
@@ -32,15 +33,22 @@ def run_migrations():
     print("✅ Migrations completed successfully!")
 
 
-def seed_database():
+async def seed_database():
     """Seed database with example data."""
     print("🌱 Seeding database with example data...")
     
-    db: Session = SessionLocal()
-    
+    try:
+        async with SessionLocal() as db:
+            await _seed_projects(db)
+    finally:
+        await engine.dispose()
+
+
+async def _seed_projects(db):
+    """Insert example projects unless the table already has data."""
     try:
         # Check if data already exists
-        existing_projects = db.query(Project).count()
+        existing_projects = await db.scalar(select(func.count()).select_from(Project))
         if existing_projects > 0:
             print(f"⚠️  Database already has {existing_projects} projects. Skipping seed.")
             return
@@ -136,15 +144,13 @@ A machine learning model to predict customer churn with 92% accuracy.
         for project in example_projects:
             db.add(project)
         
-        db.commit()
+        await db.commit()
         print(f"✅ Successfully seeded {len(example_projects)} example projects!")
         
     except Exception as e:
         print(f"❌ Error seeding database: {e}")
-        db.rollback()
+        await db.rollback()
         raise
-    finally:
-        db.close()
 
 
 def main():
@@ -166,7 +172,7 @@ def main():
         
         # Seed if requested
         if args.seed:
-            seed_database()
+            asyncio.run(seed_database())
         
         print("\n🎉 Database initialization completed!")
         
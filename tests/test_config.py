@@ -0,0 +1,56 @@
+"""
+Tests for application settings parsing.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from app.core.config import Settings
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("", ()),
+    ("http://localhost:3000", ("http://localhost:3000",)),
+    (
+        "http://localhost:3000, https://example.com,",
+        ("http://localhost:3000", "https://example.com"),
+    ),
+    (
+        '["http://localhost:3000", "https://example.com"]',
+        ("http://localhost:3000", "https://example.com"),
+    ),
+    (["http://localhost:3000"], ("http://localhost:3000",)),
+    (("http://localhost:3000", "https://example.com"), ("http://localhost:3000", "https://example.com")),
+    ([], ()),
+])
+def test_assemble_cors_origins(value, expected):
+    assert Settings.assemble_cors_origins(value) == expected
+
+
+def test_assemble_cors_origins_rejects_other_types():
+    with pytest.raises(ValueError):
+        Settings.assemble_cors_origins(42)
+
+
+def test_cors_origins_default_to_empty_tuple(monkeypatch):
+    monkeypatch.delenv("BACKEND_CORS_ORIGINS", raising=False)
+    
+    assert Settings(_env_file=None).BACKEND_CORS_ORIGINS == ()
+
+
+@pytest.mark.parametrize("env_value, expected", [
+    ("http://localhost:3000,https://example.com", ("http://localhost:3000", "https://example.com")),
+    ('["http://localhost:3000","https://example.com"]', ("http://localhost:3000", "https://example.com")),
+    ("http://localhost:3000", ("http://localhost:3000",)),
+])
+def test_cors_origins_from_environment(monkeypatch, env_value, expected):
+    monkeypatch.setenv("BACKEND_CORS_ORIGINS", env_value)
+    
+    assert Settings(_env_file=None).BACKEND_CORS_ORIGINS == expected
+
+
+def test_cors_origins_rejects_malformed_json(monkeypatch):
+    monkeypatch.setenv("BACKEND_CORS_ORIGINS", '["http://localhost:3000"')
+    
+    with pytest.raises(ValidationError):
+        Settings(_env_file=None)
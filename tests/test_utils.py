@@ -0,0 +1,137 @@
+"""
+Tests for slug generation, pagination cursors and ETag matching.
+"""
+
+import base64
+import random
+import re
+import unicodedata
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.api.v1.projects import _etag_matches
+from app.core.utils import decode_cursor, encode_cursor, generate_slug
+
+
+def _reference_slug(text: str) -> str:
+    """Original regex-based generate_slug, kept as the behavioural reference."""
+    text = unicodedata.normalize('NFKD', text)
+    text = text.encode('ascii', 'ignore').decode('ascii')
+    text = text.lower()
+    text = re.sub(r'[\s_]+', '-', text)
+    text = re.sub(r'[^a-z0-9-]', '', text)
+    text = re.sub(r'-+', '-', text)
+    return text.strip('-')
+
+
+def _raw_cursor(payload: str) -> str:
+    """Encode an arbitrary JSON payload the way encode_cursor does."""
+    return base64.urlsafe_b64encode(payload.encode()).decode("ascii")
+
+
+# Slugs
+
+@pytest.mark.parametrize("text, expected", [
+    ("Hello World!", "hello-world"),
+    ("Data Pipeline 2024", "data-pipeline-2024"),
+    ("São Paulo Analytics", "sao-paulo-analytics"),
+    ("  snake_case -- and   spaces ", "snake-case-and-spaces"),
+    ("Don't Stop", "dont-stop"),
+    ("", ""),
+    ("!!!", ""),
+])
+def test_generate_slug_examples(text, expected):
+    assert generate_slug(text) == expected
+
+
+@pytest.mark.parametrize("text", [
+    "Ünïcödé Çafé",
+    "ﬁnance ½ report",
+    "tab\there\nnewline nbsp em",
+    "日本語 title",
+    "a​b",
+    "Ⅻ ⑤ ²",
+    "-_- leading and trailing _-_",
+    "İstanbul ǅ",
+])
+def test_generate_slug_matches_reference_on_unicode(text):
+    assert generate_slug(text) == _reference_slug(text)
+
+
+def test_generate_slug_matches_reference_on_random_input():
+    rng = random.Random(0)
+    alphabet = (
+        "abcXYZ019 _-\t\n.,!'\"/\\"
+        "áéíóúãõçñüß  　ﬁ½²Ⅻİǅ日本​́"
+    )
+    for _ in range(5000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 24)))
+        assert generate_slug(text) == _reference_slug(text), text
+
+
+# Cursors
+
+@pytest.mark.parametrize("created_at, item_id", [
+    (datetime(2024, 5, 17, 13, 45, 12, 123456), 42),
+    (datetime(2024, 1, 1), 1),
+    (datetime(1999, 12, 31, 23, 59, 59), 2**31 - 1),
+])
+def test_cursor_round_trip(created_at, item_id):
+    cursor = encode_cursor(created_at, item_id)
+    
+    assert re.fullmatch(r"[A-Za-z0-9_=-]+", cursor)
+    assert len(cursor) <= 128
+    assert decode_cursor(cursor) == (created_at, item_id)
+
+
+@pytest.mark.parametrize("cursor", [
+    "not base64!",
+    _raw_cursor("not json"),
+    _raw_cursor("{}"),
+    _raw_cursor("[]"),
+    _raw_cursor("[5, 1]"),
+    _raw_cursor('["2024-01-01T00:00:00"]'),
+    _raw_cursor('["2024-01-01T00:00:00", 1, 2]'),
+    _raw_cursor('["yesterday", 1]'),
+    _raw_cursor('["2024-01-01T00:00:00", 1e400]'),
+    _raw_cursor('["2024-01-01T00:00:00", 1.5]'),
+    _raw_cursor('["2024-01-01T00:00:00", true]'),
+    _raw_cursor('["2024-01-01T00:00:00", "1"]'),
+    _raw_cursor(f'["2024-01-01T00:00:00", {2**31}]'),
+    _raw_cursor(f'["2024-01-01T00:00:00", {-2**31 - 1}]'),
+    _raw_cursor('["2024-01-01T00:00:00+00:00", 1]'),
+    _raw_cursor("[" * 3000),
+])
+def test_decode_cursor_rejects_malformed_input(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_decode_cursor_rejects_timezone_aware_timestamp():
+    aware = datetime(2024, 1, 1, tzinfo=timezone(timedelta(hours=-3)))
+    
+    with pytest.raises(ValueError, match="timezone-aware"):
+        decode_cursor(encode_cursor(aware, 1))
+
+
+# ETags
+
+ETAG = 'W/"1717000000.0-3-abc"'
+
+
+@pytest.mark.parametrize("if_none_match, expected", [
+    (None, False),
+    ("", False),
+    ("*", True),
+    (" * ", True),
+    (ETAG, True),
+    ('"1717000000.0-3-abc"', True),
+    ('W/"other"', False),
+    (f'"other", {ETAG}', True),
+    ('"other",W/"1717000000.0-3-abc"', True),
+    ('"other", "another"', False),
+    ('"1717000000.0-3-ab"', False),
+])
+def test_etag_matches(if_none_match, expected):
+    assert _etag_matches(if_none_match, ETAG) is expected